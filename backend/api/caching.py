@@ -0,0 +1,150 @@
+# backend/api/caching.py
+"""
+Cache for the generated feeds and sitemaps.
+
+Each feed and each sitemap shard is cached as its own entry, together with the
+ETag and Last-Modified validators used for conditional GET. When a post or an
+author changes, only the entries that contain it are invalidated (see
+api/signals.py); they are regenerated on the next request.
+
+Invalidation doesn't delete entries, it moves their key to a new generation
+(the cache `version`). A request that started building before an invalidation
+stores its result under the old generation, where nobody looks any more, so it
+can never overwrite the newer state.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, set_response_etag
+from django.utils.http import http_date
+from .sitemaps import shard_for_post
+
+# Entries are invalidated explicitly; the timeout only bounds how long changes
+# that bypass model signals (e.g. QuerySet.update()) can stay unnoticed.
+CACHE_TIMEOUT = 60 * 60 * 24
+
+FEED_FORMATS = ('rss', 'atom')
+
+SITEMAP_INDEX_CACHE_KEY = 'sitemap:index'
+
+
+def feed_cache_key(feed_format, author_id=None):
+    if author_id is None:
+        return f'feed:all:{feed_format}'
+    return f'feed:author:{author_id}:{feed_format}'
+
+
+def sitemap_shard_cache_key(shard):
+    return f'sitemap:shard:{shard}'
+
+
+def _generation_key(cache_key):
+    return f'{cache_key}:generation'
+
+
+def _validators_key(cache_key):
+    return f'{cache_key}:validators'
+
+
+def _new_generation():
+    # Never reused, even if a generation counter is evicted from the cache.
+    return time.time_ns()
+
+
+def cache_generation(cache_key):
+    """
+    Returns the current generation (cache version) of cache_key.
+    """
+    generation_key = _generation_key(cache_key)
+    generation = cache.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, _new_generation(), timeout=None)
+        generation = cache.get(generation_key)
+    return generation
+
+
+def cached_response(request, cache_key, build_response):
+    """
+    Returns the cached response for cache_key, calling build_response() to
+    generate and cache it first if needed. Answers conditional requests
+    (If-None-Match / If-Modified-Since) with 304 Not Modified.
+
+    Last-Modified is the time the content last changed, i.e. the time of the
+    first build with a new ETag. Rebuilding identical content keeps it, and
+    any change moves it forward, including removed posts.
+    """
+    generation = cache_generation(cache_key)
+    entry = cache.get(cache_key, version=generation)
+    if entry is None:
+        response = build_response()
+        if hasattr(response, 'render'):
+            response.render() # TemplateResponse
+        if response.status_code != 200:
+            return response # Don't cache errors such as an unknown author
+        set_response_etag(response)
+        etag = response['ETag']
+
+        previous = cache.get(_validators_key(cache_key))
+        if previous and previous['etag'] == etag:
+            last_modified = previous['last_modified']
+        else:
+            last_modified = int(time.time())
+            if previous:
+                # HTTP dates have one-second resolution: always move forward.
+                last_modified = max(last_modified, previous['last_modified'] + 1)
+        cache.set(
+            _validators_key(cache_key), {'etag': etag, 'last_modified': last_modified}, None
+        )
+
+        entry = {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+        cache.set(cache_key, entry, CACHE_TIMEOUT, version=generation)
+
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    return get_conditional_response(
+        request, etag=entry['etag'], last_modified=entry['last_modified'], response=response
+    )
+
+
+def invalidate(cache_keys):
+    """
+    Moves the given keys to a new generation, so their next request rebuilds them.
+    """
+    generation = _new_generation()
+    cache.set_many(
+        {_generation_key(cache_key): generation for cache_key in cache_keys}, timeout=None
+    )
+
+
+def invalidate_post(post_id, author_ids):
+    """
+    Invalidates the cached feeds and sitemap entries that contain the given
+    post: the global feeds, the feeds of the given authors, the post's sitemap
+    shard and the sitemap index.
+    """
+    keys = [feed_cache_key(feed_format) for feed_format in FEED_FORMATS]
+    keys += [
+        feed_cache_key(feed_format, author_id)
+        for author_id in author_ids for feed_format in FEED_FORMATS
+    ]
+    keys += [sitemap_shard_cache_key(shard_for_post(post_id)), SITEMAP_INDEX_CACHE_KEY]
+    invalidate(keys)
+
+
+def invalidate_author(author_id, include_global_feeds=False):
+    """
+    Invalidates the feeds of an author, and the global feeds too if they show
+    the author's name (i.e. when the username changed).
+    """
+    keys = [feed_cache_key(feed_format, author_id) for feed_format in FEED_FORMATS]
+    if include_global_feeds:
+        keys += [feed_cache_key(feed_format) for feed_format in FEED_FORMATS]
+    invalidate(keys)
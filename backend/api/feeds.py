@@ -0,0 +1,107 @@
+# backend/api/feeds.py
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.syndication.views import Feed
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+from .models import BlogPost
+from .utils import absolute_url
+
+FEED_ITEMS = 20 # Number of latest posts included in each feed
+
+
+def post_url(post):
+    """
+    Link to a post for feed readers: the frontend page when the deployed frontend
+    URL is known, the API detail endpoint otherwise.
+    """
+    if settings.DEPLOYED_FRONTEND_URL:
+        return f"{settings.DEPLOYED_FRONTEND_URL.rstrip('/')}/blogs/{post.pk}"
+    return absolute_url(reverse('blogpost-detail', args=[post.pk]))
+
+
+class LatestPostsFeed(Feed):
+    """
+    RSS 2.0 feed of the latest blog posts of all authors.
+    All links are absolute, so Django doesn't prefix them with the request's host.
+    """
+    feed_format = 'rss' # Matches the feed_format URL argument
+    title = "MyBlogApp: latest blog posts"
+    description = "The latest blog posts published on MyBlogApp."
+
+    def link(self):
+        if settings.DEPLOYED_FRONTEND_URL:
+            return settings.DEPLOYED_FRONTEND_URL
+        return absolute_url(reverse('blogpost-list'))
+
+    def feed_url(self):
+        return absolute_url(reverse('feed', kwargs={'feed_format': self.feed_format}))
+
+    def items(self):
+        # BlogPost is ordered newest first by default.
+        return BlogPost.objects.select_related('author')[:FEED_ITEMS]
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.content
+
+    def item_link(self, item):
+        return post_url(item)
+
+    def item_author_name(self, item):
+        return item.author.username
+
+    def item_pubdate(self, item):
+        return item.created_at
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+
+class LatestPostsAtomFeed(LatestPostsFeed):
+    """
+    Atom 1.0 variant of LatestPostsFeed.
+    """
+    feed_type = Atom1Feed
+    feed_format = 'atom'
+    subtitle = LatestPostsFeed.description
+
+
+class AuthorPostsFeed(LatestPostsFeed):
+    """
+    RSS 2.0 feed of the latest blog posts of a single author.
+    """
+
+    def get_object(self, request, author_id):
+        return get_object_or_404(User, pk=author_id)
+
+    def title(self, obj):
+        return f"MyBlogApp: latest blog posts by {obj.username}"
+
+    def description(self, obj):
+        return f"The latest blog posts published on MyBlogApp by {obj.username}."
+
+    def link(self, obj):
+        return super().link()
+
+    def feed_url(self, obj):
+        return absolute_url(reverse(
+            'author-feed', kwargs={'author_id': obj.pk, 'feed_format': self.feed_format}
+        ))
+
+    def items(self, obj):
+        return BlogPost.objects.filter(author=obj).select_related('author')[:FEED_ITEMS]
+
+
+class AuthorPostsAtomFeed(AuthorPostsFeed):
+    """
+    Atom 1.0 variant of AuthorPostsFeed.
+    """
+    feed_type = Atom1Feed
+    feed_format = 'atom'
+
+    def subtitle(self, obj):
+        return self.description(obj)
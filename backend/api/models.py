@@ -13,5 +13,13 @@ class BlogPost(models.Model):
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the author as loaded, so the feed of the previous author can be
+        # invalidated too when a post is reassigned (see api/signals.py).
+        instance._loaded_author_id = instance.__dict__.get('author_id')
+        return instance
+
     class Meta:
         ordering = ['-created_at'] # Default ordering for blog posts (newest first)
\ No newline at end of file
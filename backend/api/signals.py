@@ -0,0 +1,63 @@
+# backend/api/signals.py
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .caching import invalidate_author, invalidate_post
+from .models import BlogPost
+
+# Invalidation runs after commit, so requests made after the commit rebuild from
+# the new rows. Builds already running with the old rows can't re-cache them:
+# invalidation moves the keys to a new generation (see api/caching.py).
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_post_caches(sender, instance, **kwargs):
+    """
+    Invalidates the cached feeds and sitemap shard affected by a created,
+    updated or deleted blog post.
+    """
+    # Include the author the post was loaded with, in case it was reassigned.
+    author_ids = {instance.author_id, getattr(instance, '_loaded_author_id', None)} - {None}
+    # Values are captured now: Django clears instance.pk after a delete.
+    transaction.on_commit(partial(invalidate_post, instance.pk, author_ids))
+    # Reset, so a later save of the same instance doesn't invalidate the old author again.
+    instance._loaded_author_id = instance.author_id
+
+
+@receiver(pre_save, sender=User)
+def remember_previous_username(sender, instance, update_fields=None, **kwargs):
+    """
+    Stores the username as it is in the database, so post_save can tell
+    whether it changed.
+    """
+    instance._previous_username = None
+    if instance.pk is None or (update_fields is not None and 'username' not in update_fields):
+        return # New user, or a save that can't touch the username (e.g. last_login)
+    instance._previous_username = (
+        User.objects.filter(pk=instance.pk).values_list('username', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_caches(sender, instance, created, **kwargs):
+    """
+    Feeds show the author's username: renaming a user invalidates their feeds
+    and the global feeds.
+    """
+    previous_username = getattr(instance, '_previous_username', None)
+    if created or previous_username in (None, instance.username):
+        return
+    transaction.on_commit(partial(invalidate_author, instance.pk, include_global_feeds=True))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_author_caches(sender, instance, **kwargs):
+    """
+    A deleted author's feeds must return 404. Their posts are deleted first
+    (CASCADE), which already invalidates the global feeds.
+    """
+    transaction.on_commit(partial(invalidate_author, instance.pk))
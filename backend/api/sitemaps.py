@@ -0,0 +1,50 @@
+# backend/api/sitemaps.py
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.sitemaps import Sitemap
+from django.urls import reverse
+from .models import BlogPost
+
+# sitemaps.org limit on the number of URLs in a single sitemap file.
+SITEMAP_SHARD_SIZE = 50000
+
+
+def shard_for_post(post_id):
+    """
+    Shards are fixed id ranges (ids 1..50000 are shard 0, and so on) rather than
+    positions in the list, so adding, editing or deleting a post only ever
+    changes the one shard its id falls into.
+    """
+    return (post_id - 1) // SITEMAP_SHARD_SIZE
+
+
+class BlogPostSitemap(Sitemap):
+    """
+    Sitemap of one shard of blog posts, pointing at their API detail endpoints.
+    URLs are on the canonical origin (settings.SITE_URL), not the request's host.
+    """
+    limit = SITEMAP_SHARD_SIZE # A whole shard always fits on page 1
+
+    def __init__(self, shard):
+        self.shard = shard
+
+    def items(self):
+        return (
+            BlogPost.objects
+            .filter(id__gt=self.shard * SITEMAP_SHARD_SIZE, id__lte=(self.shard + 1) * SITEMAP_SHARD_SIZE)
+            .only('id', 'updated_at')
+            .order_by('id')
+        )
+
+    def location(self, item):
+        return reverse('blogpost-detail', args=[item.pk])
+
+    def lastmod(self, item):
+        return item.updated_at
+
+    def get_protocol(self, protocol=None):
+        return urlsplit(settings.SITE_URL).scheme
+
+    def get_domain(self, site=None):
+        return urlsplit(settings.SITE_URL).netloc
@@ -1,3 +1,276 @@
-from django.test import TestCase
+import gc
+import importlib
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import Resolver404, clear_url_caches, resolve, reverse
+
+from .caching import (
+    FEED_FORMATS, SITEMAP_INDEX_CACHE_KEY, cache_generation, cached_response,
+    feed_cache_key, invalidate_post, sitemap_shard_cache_key
+)
+from .models import BlogPost
+from .sitemaps import SITEMAP_SHARD_SIZE, shard_for_post
+from blog_project import settings as base_settings, settings_api
+from blog_project.warmup import warm_up
+
+
+@override_settings(SITE_URL='https://api.example.com', DEPLOYED_FRONTEND_URL=None)
+class FeedAndSitemapCacheTests(TestCase):
+    """
+    Tests for the cached feeds and sitemaps, and their invalidation when posts change.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.alice = User.objects.create_user(username='alice', password='password')
+        self.bob = User.objects.create_user(username='bob', password='password')
+        self.post = BlogPost.objects.create(title='First', content='Hello', author=self.alice)
+        self.bob_post = BlogPost.objects.create(title='Second', content='Hi', author=self.bob)
+
+    def fill_caches(self):
+        """
+        Requests every feed and sitemap once, so all of them are cached.
+        """
+        for feed_format in FEED_FORMATS:
+            self.client.get(reverse('feed', kwargs={'feed_format': feed_format}))
+            for author in (self.alice, self.bob):
+                self.client.get(reverse(
+                    'author-feed', kwargs={'author_id': author.pk, 'feed_format': feed_format}
+                ))
+        self.client.get(reverse('sitemap-index'))
+        self.client.get(reverse('sitemap-shard', args=[shard_for_post(self.post.pk)]))
+
+    def cached_entry(self, key):
+        return cache.get(key, version=cache_generation(key))
+
+    def assertCached(self, *keys):
+        for key in keys:
+            self.assertIsNotNone(self.cached_entry(key), key)
+
+    def assertNotCached(self, *keys):
+        for key in keys:
+            self.assertIsNone(self.cached_entry(key), key)
+
+    def feed_keys(self, author=None):
+        author_id = author.pk if author else None
+        return [feed_cache_key(feed_format, author_id) for feed_format in FEED_FORMATS]
+
+    def test_shard_for_post(self):
+        self.assertEqual(shard_for_post(1), 0)
+        self.assertEqual(shard_for_post(SITEMAP_SHARD_SIZE), 0)
+        self.assertEqual(shard_for_post(SITEMAP_SHARD_SIZE + 1), 1)
+
+    def test_save_invalidates_only_affected_entries(self):
+        self.fill_caches()
+        other_shard_key = sitemap_shard_cache_key(shard_for_post(self.post.pk) + 1)
+        cache.set(other_shard_key, {'content': b''}, version=cache_generation(other_shard_key))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = 'First, edited'
+            self.post.save()
+
+        self.assertNotCached(
+            *self.feed_keys(),
+            *self.feed_keys(self.alice),
+            sitemap_shard_cache_key(shard_for_post(self.post.pk)),
+            SITEMAP_INDEX_CACHE_KEY,
+        )
+        self.assertCached(*self.feed_keys(self.bob), other_shard_key)
+
+    def test_reassigning_post_invalidates_both_authors(self):
+        self.fill_caches()
+        post = BlogPost.objects.get(pk=self.post.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.author = self.bob
+            post.save()
+
+        self.assertNotCached(*self.feed_keys(self.alice), *self.feed_keys(self.bob))
+
+    def test_delete_invalidates_shard(self):
+        self.fill_caches()
+        post = BlogPost.objects.get(pk=self.post.pk)
+        shard_key = sitemap_shard_cache_key(shard_for_post(post.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.delete()
+
+        self.assertNotCached(shard_key, SITEMAP_INDEX_CACHE_KEY, *self.feed_keys(self.alice))
+        self.assertCached(*self.feed_keys(self.bob))
+
+    def test_conditional_get(self):
+        url = reverse('feed', kwargs={'feed_format': 'rss'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        not_modified = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_sitemap_conditional_get(self):
+        url = reverse('sitemap-shard', args=[shard_for_post(self.post.pk)])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_last_modified_kept_when_content_unchanged(self):
+        url = reverse('feed', kwargs={'feed_format': 'rss'})
+        response = self.client.get(url)
+        # Invalidating without changing the data rebuilds identical content.
+        invalidate_post(self.post.pk, {self.alice.pk})
+        rebuilt = self.client.get(url)
+        self.assertEqual(rebuilt['ETag'], response['ETag'])
+        self.assertEqual(rebuilt['Last-Modified'], response['Last-Modified'])
+
+    def test_removing_older_post_moves_last_modified_forward(self):
+        # Deleting a post that isn't the newest leaves Max('updated_at') unchanged,
+        # but the content changed, so If-Modified-Since must not yield 304.
+        urls = [
+            reverse('feed', kwargs={'feed_format': 'rss'}),
+            reverse('author-feed', kwargs={'author_id': self.alice.pk, 'feed_format': 'atom'}),
+            reverse('sitemap-shard', args=[shard_for_post(self.post.pk)]),
+        ]
+        before = {url: self.client.get(url) for url in urls}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.delete()
+
+        for url, response in before.items():
+            after = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(after.status_code, 200, url)
+            self.assertNotContains(after, 'First')
+            self.assertNotEqual(after['ETag'], response['ETag'])
+
+    def test_build_racing_with_invalidation_is_not_served(self):
+        key = feed_cache_key('rss')
+
+        def stale_build():
+            # The post changes and is invalidated while this build is running.
+            response = HttpResponse(b'stale', content_type='application/rss+xml')
+            invalidate_post(self.post.pk, {self.alice.pk})
+            return response
+
+        cached_response(RequestFactory().get('/'), key, stale_build)
+        self.assertNotCached(key)
+        response = self.client.get(reverse('feed', kwargs={'feed_format': 'rss'}))
+        self.assertNotEqual(response.content, b'stale')
+
+    def test_renaming_author_invalidates_feeds(self):
+        self.fill_caches()
+        user = User.objects.get(pk=self.alice.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.username = 'alicia'
+            user.save()
+
+        self.assertNotCached(*self.feed_keys(), *self.feed_keys(self.alice))
+        self.assertCached(*self.feed_keys(self.bob))
+        response = self.client.get(reverse('feed', kwargs={'feed_format': 'rss'}))
+        self.assertContains(response, 'alicia')
+
+    def test_saving_author_without_rename_keeps_feeds(self):
+        self.fill_caches()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alice.first_name = 'Alice'
+            self.alice.save()
+
+        self.assertCached(*self.feed_keys(), *self.feed_keys(self.alice))
+
+    def test_deleted_author_feed_returns_404(self):
+        author = User.objects.create_user(username='carol', password='password')
+        url = reverse('author-feed', kwargs={'author_id': author.pk, 'feed_format': 'rss'})
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author.delete()
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_unknown_author_not_cached(self):
+        missing_id = self.bob.pk + 100
+        response = self.client.get(reverse(
+            'author-feed', kwargs={'author_id': missing_id, 'feed_format': 'rss'}
+        ))
+        self.assertEqual(response.status_code, 404)
+        self.assertNotCached(feed_cache_key('rss', missing_id))
+
+    def test_empty_shard_not_cached(self):
+        shard = shard_for_post(self.bob_post.pk) + 1
+        response = self.client.get(reverse('sitemap-shard', args=[shard]))
+        self.assertEqual(response.status_code, 404)
+        self.assertNotCached(sitemap_shard_cache_key(shard))
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'other.example'])
+    def test_links_use_canonical_origin(self):
+        # The first request fills the cache; its Host header must not leak into it.
+        response = self.client.get(
+            reverse('feed', kwargs={'feed_format': 'atom'}), HTTP_HOST='other.example'
+        )
+        self.assertNotContains(response, 'other.example')
+        self.assertContains(response, f'https://api.example.com/api/blogs/{self.post.pk}/')
+
+        response = self.client.get(reverse('sitemap-index'), HTTP_HOST='other.example')
+        self.assertNotContains(response, 'other.example')
+        shard_url = reverse('sitemap-shard', args=[shard_for_post(self.post.pk)])
+        self.assertContains(response, f'https://api.example.com{shard_url}')
+
+
+class ApiOnlySettingsTests(SimpleTestCase):
+    """
+    Tests for the lean API-only settings profile (blog_project.settings_api).
+    SimpleTestCase: any database query fails the test.
+    """
+
+    def test_unused_apps_and_middleware_removed(self):
+        for app in ('django.contrib.admin', 'django.contrib.sessions', 'django.contrib.messages'):
+            self.assertNotIn(app, settings_api.INSTALLED_APPS)
+        for app in ('django.contrib.auth', 'rest_framework.authtoken', 'api.apps.ApiConfig'):
+            self.assertIn(app, settings_api.INSTALLED_APPS)
+        for middleware in (
+            'whitenoise.middleware.WhiteNoiseMiddleware',
+            'django.contrib.sessions.middleware.SessionMiddleware',
+            'django.middleware.csrf.CsrfViewMiddleware',
+            'django.contrib.auth.middleware.AuthenticationMiddleware',
+            'django.contrib.messages.middleware.MessageMiddleware',
+        ):
+            self.assertNotIn(middleware, settings_api.MIDDLEWARE)
+        self.assertNotIn(
+            'django.contrib.messages.context_processors.messages',
+            settings_api.TEMPLATES[0]['OPTIONS']['context_processors'],
+        )
+
+    def test_base_settings_unchanged(self):
+        self.assertIn('django.contrib.admin', base_settings.INSTALLED_APPS)
+        self.assertIn(
+            'django.contrib.messages.context_processors.messages',
+            base_settings.TEMPLATES[0]['OPTIONS']['context_processors'],
+        )
+
+    @override_settings(
+        INSTALLED_APPS=settings_api.INSTALLED_APPS,
+        MIDDLEWARE=settings_api.MIDDLEWARE,
+        TEMPLATES=settings_api.TEMPLATES,
+    )
+    def test_admin_not_routed(self):
+        # blog_project.urls checks the installed apps at import time.
+        import blog_project.urls
+        self.addCleanup(clear_url_caches)
+        self.addCleanup(importlib.reload, blog_project.urls) # Runs after the override ends
+        importlib.reload(blog_project.urls)
+        clear_url_caches()
+
+        with self.assertRaises(Resolver404):
+            resolve('/admin/')
+        self.assertEqual(resolve('/api/blogs/').url_name, 'blogpost-list')
+        self.assertEqual(resolve('/sitemap.xml').url_name, 'sitemap-index')
+
+    def test_warm_up_makes_no_queries(self):
+        self.addCleanup(gc.unfreeze)
+        warm_up()
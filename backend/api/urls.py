@@ -1,10 +1,11 @@
 # backend/api/urls.py
-from django.urls import path, include
+from django.urls import path, re_path, include
 from .views import RegisterView, LoginView, LogoutView, UserDetailView
 from rest_framework.routers import DefaultRouter
 from .views import (
     RegisterView, LoginView, LogoutView, UserDetailView,
-    BlogPostViewSet # <-- Add this
+    BlogPostViewSet, # <-- Add this
+    latest_posts_feed, author_posts_feed
 )
 
 # Create a router and register our viewsets with it.
@@ -20,6 +21,13 @@ urlpatterns = [
     path('auth/logout/', LogoutView.as_view(), name='auth-logout'),
     path('auth/user/', UserDetailView.as_view(), name='auth-user-detail'),
 
+    # Feed endpoints (RSS and Atom)
+    re_path(r'^feeds/(?P<feed_format>rss|atom)/$', latest_posts_feed, name='feed'),
+    re_path(
+        r'^feeds/authors/(?P<author_id>[0-9]+)/(?P<feed_format>rss|atom)/$',
+        author_posts_feed, name='author-feed'
+    ),
+
     # Blog post endpoints (registered via the router)
     path('', include(router.urls)), # Include the router-generated URLs
 ]
@@ -0,0 +1,10 @@
+# backend/api/utils.py
+from django.conf import settings
+
+
+def absolute_url(path):
+    """
+    Turns a site-relative path into an absolute URL on the canonical origin
+    (settings.SITE_URL), independent of the Host header of the current request.
+    """
+    return f"{settings.SITE_URL}{path}"
@@ -9,6 +9,18 @@ from .serializers import UserSerializer, RegisterSerializer, LoginSerializer, Bl
 from rest_framework import viewsets 
 from .models import BlogPost 
 from .permissions import IsAuthorOrReadOnly 
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.db.models import F, Max
+from django.http import Http404
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.views.decorators.http import require_safe
+from .caching import (
+    cached_response, feed_cache_key, sitemap_shard_cache_key, SITEMAP_INDEX_CACHE_KEY
+)
+from .feeds import LatestPostsFeed, LatestPostsAtomFeed, AuthorPostsFeed, AuthorPostsAtomFeed
+from .sitemaps import BlogPostSitemap, SITEMAP_SHARD_SIZE
+from .utils import absolute_url
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -127,3 +139,84 @@ class BlogPostViewSet(viewsets.ModelViewSet):
     # Optional: If you want to filter posts by author for a "my posts" endpoint,
     # you could add a custom action or filter backend.
     # For now, the list view shows all posts.
+
+
+# --- Feeds & Sitemap ---
+# Plain Django views (not DRF): they return XML and are served from the cache in
+# api/caching.py, which also handles conditional GET. The cached output is shared
+# by all clients, so links are built from settings.SITE_URL, not from the request.
+
+FEEDS = {
+    'rss': LatestPostsFeed(),
+    'atom': LatestPostsAtomFeed(),
+}
+AUTHOR_FEEDS = {
+    'rss': AuthorPostsFeed(),
+    'atom': AuthorPostsAtomFeed(),
+}
+
+
+@require_safe
+def latest_posts_feed(request, feed_format):
+    """
+    RSS or Atom feed of the latest blog posts of all authors.
+    """
+    return cached_response(
+        request, feed_cache_key(feed_format), lambda: FEEDS[feed_format](request)
+    )
+
+
+@require_safe
+def author_posts_feed(request, author_id, feed_format):
+    """
+    RSS or Atom feed of the latest blog posts of one author.
+    """
+    author_id = int(author_id) # Normalise, so "07" and "7" share a cache entry
+    return cached_response(
+        request,
+        feed_cache_key(feed_format, author_id),
+        lambda: AUTHOR_FEEDS[feed_format](request, author_id=author_id),
+    )
+
+
+@require_safe
+def sitemap_index(request):
+    """
+    Sitemap index listing one sitemap per shard of posts, with the latest
+    modification time (Max('updated_at')) of each shard.
+    """
+    def build():
+        shards = (
+            BlogPost.objects
+            .annotate(shard=(F('id') - 1) / SITEMAP_SHARD_SIZE)
+            .values('shard')
+            .annotate(lastmod=Max('updated_at'))
+            .order_by('shard')
+        )
+        sitemaps = [
+            SitemapIndexItem(
+                absolute_url(reverse('sitemap-shard', args=[row['shard']])), row['lastmod']
+            )
+            for row in shards
+        ]
+        return TemplateResponse(
+            request, 'sitemap_index.xml', {'sitemaps': sitemaps}, content_type='application/xml'
+        )
+
+    return cached_response(request, SITEMAP_INDEX_CACHE_KEY, build)
+
+
+@require_safe
+def sitemap_shard(request, shard):
+    """
+    One sitemap shard: the posts whose ids fall into the shard's range.
+    """
+    def build():
+        urls = BlogPostSitemap(shard).get_urls()
+        if not urls:
+            raise Http404("No such sitemap shard.")
+        return TemplateResponse(
+            request, 'sitemap.xml', {'urlset': urls}, content_type='application/xml'
+        )
+
+    return cached_response(request, sitemap_shard_cache_key(shard), build)
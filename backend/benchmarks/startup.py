@@ -0,0 +1,203 @@
+# backend/benchmarks/startup.py
+"""
+Startup-time and per-worker memory benchmark for gunicorn.
+
+Compares the default settings with the lean API-only profile:
+
+  * import time of the WSGI application, measured with `python -X importtime`
+  * time until `gunicorn -c gunicorn.conf.py` has booted all its workers
+  * memory of every forked worker, read from /proc/<pid>/smaps_rollup:
+    Pss (its fair share of the pages shared with the master and the other
+    workers) and Private (pages only it uses). Private is what each extra
+    worker really costs; preload_app and gc.freeze() in gunicorn.conf.py keep
+    it low by sharing the preloaded application through copy-on-write.
+
+Linux only (smaps_rollup). Run from the backend/ directory; gunicorn must be
+installed. No database connection is made while the workers are idle.
+    python benchmarks/startup.py
+    python benchmarks/startup.py --workers 4 --runs 5 blog_project.settings_api
+"""
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_SETTINGS_MODULES = ['blog_project.settings', 'blog_project.settings_api']
+
+# Imports what a worker imports: the WSGI application and the warm-up.
+IMPORT_SNIPPET = """
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+from blog_project.warmup import warm_up
+warm_up()
+"""
+
+BOOT_TIMEOUT = 60 # Seconds to wait for all workers to come up
+SETTLE_TIME = 2 # Seconds to let the workers finish booting before measuring
+
+
+def child_env(settings_module):
+    env = os.environ.copy()
+    env['DJANGO_SETTINGS_MODULE'] = settings_module
+    # Settings only need a non-empty key to load.
+    env.setdefault('DJANGO_SECRET_KEY', 'benchmark-only-secret-key')
+    return env
+
+
+def measure_import_time(settings_module):
+    """
+    Returns (total microseconds, [(cumulative microseconds, module), ...]) for
+    importing everything the WSGI application pulls in.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        env=child_env(settings_module),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{settings_module}: import failed\n{result.stderr}")
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module>"
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        if not module.startswith('  '):  # Top-level imports only
+            modules.append((int(cumulative_us), module.strip()))
+    modules.sort(reverse=True)
+    return total_us, modules
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def child_pids(parent_pid):
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                # The command name (field 2) may contain spaces; ppid follows it.
+                fields = stat.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue # Process exited meanwhile
+        if int(fields[1]) == parent_pid:
+            pids.append(int(entry))
+    return pids
+
+
+def smaps_rollup(pid):
+    """
+    Returns {'rss': kB, 'pss': kB, 'private': kB} for a process.
+    """
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as rollup:
+        for line in rollup:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                values[parts[0].rstrip(':')] = int(parts[1])
+    return {
+        'rss': values['Rss'],
+        'pss': values['Pss'],
+        'private': values['Private_Clean'] + values['Private_Dirty'],
+    }
+
+
+def measure_workers(settings_module, workers):
+    """
+    Starts gunicorn with the project's gunicorn.conf.py and returns
+    (seconds until all workers were forked, master memory, [worker memory, ...]).
+    """
+    # A file rather than a pipe, so a chatty log can never block gunicorn.
+    log = tempfile.TemporaryFile(mode='w+')
+    master = subprocess.Popen(
+        [
+            sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+            '--workers', str(workers), '--bind', f'127.0.0.1:{free_port()}',
+        ],
+        cwd=BACKEND_DIR,
+        env=child_env(settings_module),
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+    )
+    start = time.perf_counter()
+    try:
+        while len(child_pids(master.pid)) < workers:
+            if master.poll() is not None:
+                log.seek(0)
+                raise SystemExit(f"{settings_module}: gunicorn exited\n{log.read()}")
+            if time.perf_counter() - start > BOOT_TIMEOUT:
+                raise SystemExit(f"{settings_module}: workers did not boot in {BOOT_TIMEOUT}s")
+            time.sleep(0.05)
+        boot_seconds = time.perf_counter() - start
+
+        time.sleep(SETTLE_TIME)
+        return (
+            boot_seconds,
+            smaps_rollup(master.pid),
+            [smaps_rollup(pid) for pid in child_pids(master.pid)],
+        )
+    finally:
+        master.send_signal(signal.SIGTERM)
+        try:
+            master.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            master.kill()
+            master.wait()
+        log.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('settings_modules', nargs='*', default=DEFAULT_SETTINGS_MODULES)
+    parser.add_argument('--runs', type=int, default=3, help='measurements per settings module')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn workers to start')
+    parser.add_argument('--top', type=int, default=10, help='slowest top-level imports to list')
+    args = parser.parse_args()
+
+    for settings_module in args.settings_modules:
+        import_runs = [measure_import_time(settings_module) for _ in range(args.runs)]
+        worker_runs = [measure_workers(settings_module, args.workers) for _ in range(args.runs)]
+
+        import_ms = statistics.median(total for total, _ in import_runs) / 1000
+        boot_ms = statistics.median(boot for boot, _, _ in worker_runs) * 1000
+        master_pss = statistics.median(master['pss'] for _, master, _ in worker_runs) / 1024
+        all_workers = [worker for _, _, workers in worker_runs for worker in workers]
+        worker_rss = statistics.median(worker['rss'] for worker in all_workers) / 1024
+        worker_pss = statistics.median(worker['pss'] for worker in all_workers) / 1024
+        worker_private = statistics.median(worker['private'] for worker in all_workers) / 1024
+        total_pss = master_pss + worker_pss * args.workers
+
+        print(f"== {settings_module} (median of {args.runs} runs, {args.workers} workers)")
+        print(f"   import time:      {import_ms:8.1f} ms")
+        print(f"   gunicorn boot:    {boot_ms:8.1f} ms")
+        print(f"   worker RSS:       {worker_rss:8.1f} MB")
+        print(f"   worker Pss:       {worker_pss:8.1f} MB")
+        print(f"   worker Private:   {worker_private:8.1f} MB")
+        print(f"   master Pss:       {master_pss:8.1f} MB")
+        print(f"   total Pss:        {total_pss:8.1f} MB")
+        print("   slowest top-level imports (last run):")
+        for cumulative_us, module in import_runs[-1][1][:args.top]:
+            print(f"     {cumulative_us / 1000:8.1f} ms  {module}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,8 @@
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-import dj_database_url
+# dotenv and dj_database_url are imported lazily below, only on the code paths
+# that need them, to keep worker startup cheap.
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -12,6 +12,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # This is primarily for local development. On Render, variables are set in the dashboard.
 dotenv_path = BASE_DIR / '.env'
 if os.path.exists(dotenv_path):
+    from dotenv import load_dotenv
     load_dotenv(dotenv_path)
 
 # --- Core Settings ---
@@ -36,6 +37,21 @@ if 'RENDER' not in os.environ:
     ALLOWED_HOSTS.extend(['localhost', '127.0.0.1'])
 # Note: Your deployed frontend URL will be added to CORS_ALLOWED_ORIGINS and CSRF_TRUSTED_ORIGINS
 
+# Render terminates TLS at its proxy and forwards the original scheme in
+# X-Forwarded-Proto, so request.is_secure() is only correct with this header.
+if 'RENDER' in os.environ:
+    SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+
+# Canonical origin of this backend. Absolute links in feeds and sitemaps are
+# built from it, never from the client-supplied Host header, because the
+# generated files are cached and served to everyone.
+if os.environ.get('SITE_URL'):
+    SITE_URL = os.environ['SITE_URL'].rstrip('/')
+elif RENDER_EXTERNAL_HOSTNAME:
+    SITE_URL = f'https://{RENDER_EXTERNAL_HOSTNAME}'
+else:
+    SITE_URL = 'http://127.0.0.1:8000'
+
 
 # --- Application Definition ---
 INSTALLED_APPS = [
@@ -45,6 +61,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles', # For collectstatic
+    'django.contrib.sitemaps', # Provides the sitemap.xml templates
 
     # Third-party apps
     'rest_framework',
@@ -91,6 +108,7 @@ WSGI_APPLICATION = 'blog_project.wsgi.application'
 # https://docs.djangoproject.com/en/stable/ref/settings/#databases
 # On Render, DATABASE_URL is provided. For local, use .env variables.
 if 'DATABASE_URL' in os.environ and os.environ['DATABASE_URL']:
+    import dj_database_url
     DATABASES = {
         'default': dj_database_url.config(
             conn_max_age=600, # Optional: Number of seconds database connections should persist
@@ -110,6 +128,22 @@ else: # Local development fallback using .env variables
     }
 
 
+# --- Cache ---
+# https://docs.djangoproject.com/en/stable/topics/cache/#database-caching
+# Holds the generated feeds and sitemap shards. A database cache is shared by all
+# gunicorn workers, so an entry invalidated by one worker is gone for all of them.
+# Create the table with: python manage.py createcachetable
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        # Every feed and shard also keeps a generation and validators entry
+        # (see api/caching.py); the default of 300 entries would cull them early.
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+
 # --- Password Validation ---
 # https://docs.djangoproject.com/en/stable/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -0,0 +1,53 @@
+# backend/blog_project/settings_api.py
+#
+# Lean "API-only" settings profile for the gunicorn workers.
+# The React frontend only talks to the token-authenticated JSON API, so the
+# admin, sessions, messages and the browsable API are dead weight in production.
+# Enable with: DJANGO_SETTINGS_MODULE=blog_project.settings_api
+
+import copy
+
+from .settings import *  # noqa: F401,F403
+
+# --- Application Definition ---
+# contrib.auth and contenttypes stay: BlogPost.author points at auth.User and
+# authtoken depends on both.
+_UNUSED_APPS = {
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+}
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in _UNUSED_APPS]
+
+# TokenAuthentication sets request.user inside DRF, and DRF only enforces CSRF
+# for SessionAuthentication, so the session/auth/csrf/messages middleware never
+# do anything useful for API requests. WhiteNoise is dropped too: without the
+# admin and browsable API there are no static files left to serve.
+_UNUSED_MIDDLEWARE = {
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+}
+MIDDLEWARE = [mw for mw in MIDDLEWARE if mw not in _UNUSED_MIDDLEWARE]
+
+# The messages context processor would fail without the messages app.
+# Work on a copy: the nested dicts are shared with blog_project.settings.
+TEMPLATES = copy.deepcopy(TEMPLATES)
+TEMPLATES[0]['OPTIONS']['context_processors'] = [
+    cp for cp in TEMPLATES[0]['OPTIONS']['context_processors']
+    if cp != 'django.contrib.messages.context_processors.messages'
+]
+
+
+# --- Django REST Framework Settings ---
+# JSON only. BrowsableAPIRenderer lives in the same module as JSONRenderer, so this
+# saves no imports at startup; it only avoids rendering the browsable API's
+# templates (and their extra queries) when a response is served.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': (
+        'rest_framework.renderers.JSONRenderer',
+    ),
+}
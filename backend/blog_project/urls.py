@@ -14,10 +14,18 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include # Add include
+from api.views import sitemap_index, sitemap_shard
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/', include('api.urls')), # Add this line
-]
\ No newline at end of file
+    # Served from the site root so the sitemap may list every URL on the host.
+    path('sitemap.xml', sitemap_index, name='sitemap-index'),
+    path('sitemap-<int:shard>.xml', sitemap_shard, name='sitemap-shard'),
+]
+
+# The API-only settings profile (blog_project.settings_api) drops the admin app.
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
\ No newline at end of file
@@ -0,0 +1,54 @@
+# backend/blog_project/warmup.py
+"""
+Pre-fork warm-up for gunicorn (see backend/gunicorn.conf.py).
+
+With preload_app the master process imports the WSGI application once and
+forks the workers from it. Anything that is lazily built on the first request
+(URL resolver, view classes, serializer fields) is built here instead, so each
+worker inherits it through copy-on-write rather than paying for it again.
+"""
+
+import gc
+
+from django.db import connections
+from django.urls import get_resolver
+
+
+def warm_up_url_resolvers():
+    """
+    Populates the root URL resolver, which also imports all view modules
+    referenced from the URLconf. _populate() recurses into every included
+    resolver (api.urls, the router) on its own.
+    """
+    get_resolver().reverse_dict
+
+
+def warm_up_serializers():
+    """
+    Builds the fields of every API serializer once. This imports the DRF field
+    and validator machinery and fills the model _meta caches that
+    ModelSerializer relies on. No database query is made: the queryset on
+    PrimaryKeyRelatedField is only evaluated during validation.
+    """
+    from api.serializers import (
+        UserSerializer, RegisterSerializer, LoginSerializer, BlogPostSerializer
+    )
+
+    for serializer_class in (UserSerializer, RegisterSerializer, LoginSerializer, BlogPostSerializer):
+        serializer_class().fields
+
+
+def warm_up():
+    """
+    Runs all warm-up steps, then prepares the master process for forking.
+    """
+    warm_up_url_resolvers()
+    warm_up_serializers()
+
+    # Never share a database socket between forked workers.
+    connections.close_all()
+
+    # Move everything allocated so far into the permanent generation, so the
+    # workers' garbage collector does not touch (and copy) those pages.
+    gc.collect()
+    gc.freeze()
@@ -10,4 +10,7 @@ pip install -r requirements.txt
 python manage.py collectstatic --no-input
 
 # Apply database migrations
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+
+# Create the cache table used for feeds and sitemaps
+python manage.py createcachetable
\ No newline at end of file
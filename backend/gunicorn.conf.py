@@ -0,0 +1,22 @@
+# backend/gunicorn.conf.py
+# Picked up automatically by `gunicorn blog_project.wsgi` when run from backend/.
+# Pair it with DJANGO_SETTINGS_MODULE=blog_project.settings_api for the lean
+# API-only profile.
+
+import os
+
+wsgi_app = 'blog_project.wsgi:application'
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+
+# Import Django and the whole project once in the master, then fork workers
+# from it, instead of every worker importing everything on its own.
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preloaded app is imported and before any
+    # worker is forked.
+    from blog_project.warmup import warm_up
+    warm_up()
+    server.log.info("Django URL resolvers and serializers warmed up before fork")